@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Dict, Optional
 import logging
+import time
 from datetime import datetime
 
 from config import Config
@@ -23,6 +24,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cached (epoch second, ISO string) pair for response timestamps
+_TS_CACHE = [0, ""]
+
+
+def _utcnow_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string (second resolution).
+
+    The formatted string is reused for every response within the same second.
+    """
+    now = int(time.time())
+    if _TS_CACHE[0] != now:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.utcfromtimestamp(now).isoformat()
+    return _TS_CACHE[1]
+
 # Initialize FastAPI app
 app = FastAPI(
     title="RetinaScan AI API",
@@ -120,7 +137,7 @@ async def health_check():
     
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_utcnow_iso(),
         model_loaded=model_manager.model_loaded,
         model_info=model_info
     )
@@ -164,7 +181,7 @@ async def predict_retinopathy(file: UploadFile = File(...)):
             recommendation=prediction['recommendation'],
             structured_recommendation=prediction['structured_recommendation'],
             class_probabilities=formatted_probs,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_utcnow_iso()
         )
         
     except HTTPException:
@@ -193,7 +210,7 @@ async def http_exception_handler(request, exc):
         content=ErrorResponse(
             success=False,
             error=exc.detail,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_utcnow_iso()
         ).dict()
     )
 
@@ -208,7 +225,7 @@ async def general_exception_handler(request, exc):
             success=False,
             error="Internal server error",
             detail=str(exc),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_utcnow_iso()
         ).dict()
     )
 
@@ -18,6 +18,7 @@ class ModelManager:
     def __init__(self):
         self.model = None
         self.model_loaded = False
+        self._model_info = None
         
     def load_model(self, model_path: Optional[str] = None) -> bool:
         """
@@ -29,6 +30,8 @@ class ModelManager:
         Returns:
             True if model loaded successfully, False otherwise
         """
+        self._model_info = None
+        
         try:
             import tensorflow as tf
             
@@ -145,6 +148,9 @@ class ModelManager:
         """
         Get information about the loaded model
         
+        Metadata is computed once per loaded model and cached, since
+        health checks call this on every request.
+        
         Returns:
             Dictionary with model metadata
         """
@@ -155,8 +161,11 @@ class ModelManager:
                 "error": "Model not loaded"
             }
         
+        if self._model_info is not None:
+            return dict(self._model_info)
+        
         try:
-            return {
+            self._model_info = {
                 "loaded": True,
                 "model_path": Config.MODEL_PATH,
                 "input_shape": str(self.model.input_shape),
@@ -164,6 +173,7 @@ class ModelManager:
                 "num_classes": Config.NUM_CLASSES,
                 "total_params": self.model.count_params()
             }
+            return dict(self._model_info)
         except Exception as e:
             return {
                 "loaded": True,